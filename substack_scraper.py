@@ -1,16 +1,24 @@
 import argparse
-import json
+import multiprocessing
 import os
+import queue
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from string import Template
 from typing import List, Optional, Tuple
 from time import sleep
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import html2text
-import markdown
+import soupsieve as sv
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
-from xml.etree import ElementTree as ET
+from lxml import etree
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -20,13 +28,40 @@ from selenium.webdriver.chrome.service import Service
 from urllib.parse import urlparse
 from config import EMAIL, PASSWORD
 
+try:
+    import fast_h2m  # Rust-backed HTML to Markdown converter, much faster than html2text
+except ImportError:
+    fast_h2m = None
+
 USE_PREMIUM: bool = False  # Set to True if you want to login to Substack and convert paid for posts
+USE_FAST_H2M: bool = fast_h2m is not None  # Set to False to force html2text even when fast_h2m is installed
 BASE_SUBSTACK_URL: str = "https://www.thefitzwilliam.com/"  # Substack you want to convert to markdown
 BASE_MD_DIR: str = "substack_md_files"  # Name of the directory we'll save the .md essay files
 BASE_HTML_DIR: str = "substack_html_pages"  # Name of the directory we'll save the .html essay files
 HTML_TEMPLATE: str = "author_template.html"  # HTML template to use for the author page
 JSON_DATA_DIR: str = "data"
 NUM_POSTS_TO_SCRAPE: int = 3  # Set to 0 if you want all posts
+MAX_CONCURRENT_FETCHES: int = 16  # Number of posts fetched in parallel by the free scraper
+REQUEST_TIMEOUT: Tuple[int, int] = (5, 30)  # (connect, read) timeouts in seconds
+USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# extract_post_data only ever queries these subtrees; straining to them keeps the
+# parser from building the rest of the page (nav, comments, recommendations).
+# Class-less elements stay in so the bare h2 title fallback keeps working.
+POST_CONTENT_CLASS_TOKENS: Tuple[str, ...] = (
+    "post-title", "subtitle", "available-content", "pencraft", "post-ufi-button", "paywall-title"
+)
+POST_CONTENT_STRAINER = SoupStrainer(
+    ["h1", "h2", "h3", "div", "a"],
+    attrs={"class": lambda c: c is None or any(token in c for token in POST_CONTENT_CLASS_TOKENS)}
+)
+
+# Selectors used on every post, compiled once instead of re-tokenized per call
+SEL_TITLE = sv.compile("h1.post-title, h2")
+SEL_SUBTITLE = sv.compile("h3.subtitle")
+SEL_DATE = sv.compile("div._meta_3axfk_442")
+SEL_LIKE_COUNT = sv.compile("a.post-ufi-button .label")
+SEL_CONTENT = sv.compile("div.available-content")
 
 
 def extract_main_part(url: str) -> str:
@@ -35,27 +70,38 @@ def extract_main_part(url: str) -> str:
 
 
 def generate_html_file(author_name: str) -> None:
-    if not os.path.exists(BASE_HTML_DIR):
-        os.makedirs(BASE_HTML_DIR)
+    os.makedirs(BASE_HTML_DIR, exist_ok=True)
 
     json_path = os.path.join(JSON_DATA_DIR, f'{author_name}.json')
-    with open(json_path, 'r', encoding='utf-8') as file:
-        essays_data = json.load(file)
+    with open(json_path, 'rb') as file:
+        essays_data = orjson.loads(file.read())
 
-    embedded_json_data = json.dumps(essays_data, ensure_ascii=False, indent=4)
+    # The embedded blob is only read by populate-essays.js, so no indentation
+    embedded_json_data = orjson.dumps(essays_data).decode()
 
     with open(HTML_TEMPLATE, 'r', encoding='utf-8') as file:
-        html_template = file.read()
+        html_template = Template(file.read())
 
-    html_with_data = html_template.replace('<!-- AUTHOR_NAME -->', author_name).replace(
-        '<script type="application/json" id="essaysData"></script>',
-        f'<script type="application/json" id="essaysData">{embedded_json_data}</script>'
+    html_with_data = html_template.safe_substitute(
+        AUTHOR_NAME=author_name,
+        ESSAYS_JSON=embedded_json_data
     )
-    html_with_author = html_with_data.replace('author_name', author_name)
 
     html_output_path = os.path.join(BASE_HTML_DIR, f'{author_name}.html')
     with open(html_output_path, 'w', encoding='utf-8') as file:
-        file.write(html_with_author)
+        file.write(html_with_data)
+
+
+def _parse_and_convert(url: str, html: bytes) -> Optional[Tuple[str, str, str, str, str, str]]:
+    """Parse one post page and convert it to markdown.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=POST_CONTENT_STRAINER)
+    if soup.find("h2", class_="paywall-title"):
+        print(f"Skipping premium article: {url}")
+        return None
+    return BaseSubstackScraper.extract_post_data(soup)
 
 
 class BaseSubstackScraper(ABC):
@@ -70,67 +116,99 @@ class BaseSubstackScraper(ABC):
         self.md_save_dir: str = md_save_dir
         self.html_save_dir: str = f"{html_save_dir}/{self.writer_name}"
 
-        if not os.path.exists(md_save_dir):
-            os.makedirs(md_save_dir)
-            print(f"Created md directory {md_save_dir}")
-        if not os.path.exists(self.html_save_dir):
-            os.makedirs(self.html_save_dir)
-            print(f"Created html directory {self.html_save_dir}")
+        # exist_ok avoids a stat per directory and the TOCTOU race between
+        # concurrent workers; all output directories are created up front
+        os.makedirs(self.md_save_dir, exist_ok=True)
+        os.makedirs(self.html_save_dir, exist_ok=True)
+        os.makedirs(JSON_DATA_DIR, exist_ok=True)
 
+        self.session: requests.Session = self._create_session()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=64)
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         self.keywords: List[str] = ["about", "archive", "podcast"]
+        self._keyword_re: re.Pattern = re.compile('|'.join(map(re.escape, self.keywords)))
+        # Specialized filename helpers for the scrape loop; both filetypes are
+        # constants, so skip the per-call normalization in get_filename_from_url
+        self._md_filename = lambda url: url.rsplit('/', 1)[-1] + '.md'
+        self._html_filename = lambda url: url.rsplit('/', 1)[-1] + '.html'
         self.post_urls: List[str] = self.get_all_post_urls()
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+        return session
+
     def get_all_post_urls(self) -> List[str]:
         urls = self.fetch_urls_from_sitemap()
         if not urls:
             urls = self.fetch_urls_from_feed()
-        return self.filter_urls(urls, self.keywords)
+        return self.filter_urls(urls, self._keyword_re)
 
     def fetch_urls_from_sitemap(self) -> List[str]:
         sitemap_url = f"{self.base_substack_url}sitemap.xml"
-        response = requests.get(sitemap_url)
-
-        if not response.ok:
-            print(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
-            return []
-
-        root = ET.fromstring(response.content)
-        urls = [element.text for element in root.iter('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')]
-        return urls
+        with self.session.get(sitemap_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if not response.ok:
+                print(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
+                return []
+
+            response.raw.decode_content = True
+            urls = []
+            for _, element in etree.iterparse(
+                    response.raw, tag='{http://www.sitemaps.org/schemas/sitemap/0.9}loc'
+            ):
+                urls.append(element.text)
+                element.clear()
+            return urls
 
     def fetch_urls_from_feed(self) -> List[str]:
         print('Falling back to feed.xml. This will only contain up to the 22 most recent posts.')
         feed_url = f"{self.base_substack_url}feed.xml"
-        response = requests.get(feed_url)
-
-        if not response.ok:
-            print(f'Error fetching feed at {feed_url}: {response.status_code}')
-            return []
-
-        root = ET.fromstring(response.content)
-        urls = []
-        for item in root.findall('.//item'):
-            link = item.find('link')
-            if link is not None and link.text:
-                urls.append(link.text)
-
-        return urls
+        with self.session.get(feed_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if not response.ok:
+                print(f'Error fetching feed at {feed_url}: {response.status_code}')
+                return []
+
+            response.raw.decode_content = True
+            urls = []
+            for _, element in etree.iterparse(response.raw, tag='link'):
+                parent = element.getparent()
+                if parent is not None and parent.tag == 'item' and element.text:
+                    urls.append(element.text)
+                element.clear()
+            return urls
 
     @staticmethod
-    def filter_urls(urls: List[str], keywords: List[str]) -> List[str]:
-        return [url for url in urls if all(keyword not in url for keyword in keywords)]
+    def filter_urls(urls: List[str], keyword_re: re.Pattern) -> List[str]:
+        return [url for url in urls if not keyword_re.search(url)]
 
     @staticmethod
     def html_to_md(html_content: str) -> str:
         if not isinstance(html_content, str):
             raise ValueError("html_content must be a string")
+        if USE_FAST_H2M:
+            return fast_h2m.convert(html_content, body_width=0, ignore_links=False)
+        # A fresh instance per document: html2text keeps document state that
+        # only __init__ resets, so instances cannot safely be reused
         h = html2text.HTML2Text()
         h.ignore_links = False
         h.body_width = 0
         return h.handle(html_content)
 
-    @staticmethod
-    def save_to_file(filepath: str, content: str) -> None:
+    def _writer_loop(self) -> None:
+        while True:
+            filepath, content = self._write_queue.get()
+            try:
+                with open(filepath, 'w', encoding='utf-8') as file:
+                    file.write(content)
+            except OSError as e:
+                print(f"Error writing {filepath}: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def save_to_file(self, filepath: str, content: str) -> None:
         if not isinstance(filepath, str):
             raise ValueError("filepath must be a string")
 
@@ -141,12 +219,7 @@ class BaseSubstackScraper(ABC):
             print(f"File already exists: {filepath}")
             return
 
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(content)
-
-    @staticmethod
-    def md_to_html(md_content: str) -> str:
-        return markdown.markdown(md_content, extensions=['extra'])
+        self._write_queue.put((filepath, content))
 
     def save_to_html_file(self, filepath: str, content: str) -> None:
         if not isinstance(filepath, str):
@@ -176,21 +249,14 @@ class BaseSubstackScraper(ABC):
             </html>
         """
 
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(html_content)
+        self._write_queue.put((filepath, html_content))
 
     @staticmethod
     def get_filename_from_url(url: str, filetype: str = ".md") -> str:
-        if not isinstance(url, str):
-            raise ValueError("url must be a string")
-
-        if not isinstance(filetype, str):
-            raise ValueError("filetype must be a string")
-
         if not filetype.startswith("."):
             filetype = f".{filetype}"
 
-        return url.split("/")[-1] + filetype
+        return url.rsplit("/", 1)[-1] + filetype
 
     @staticmethod
     def combine_metadata_and_content(title: str, subtitle: str, date: str, like_count: str, content) -> str:
@@ -208,69 +274,91 @@ class BaseSubstackScraper(ABC):
 
         return metadata + content
 
-    def extract_post_data(self, soup: BeautifulSoup) -> Optional[Tuple[str, str, str, str, str]]:
-        title_element = soup.select_one("h1.post-title, h2")
+    @classmethod
+    def extract_post_data(cls, soup: BeautifulSoup) -> Optional[Tuple[str, str, str, str, str, str]]:
+        title_element = SEL_TITLE.select_one(soup)
         if title_element is None or not title_element.text.strip():
             print("No title found, skipping this post.")
             return None
 
         title = title_element.text.strip()
 
-        subtitle_element = soup.select_one("h3.subtitle")
+        subtitle_element = SEL_SUBTITLE.select_one(soup)
         subtitle = subtitle_element.text.strip() if subtitle_element and subtitle_element.text else ""
 
-        date_element = soup.find(
-            "div",
-            class_="pencraft pc-reset _color-pub-secondary-text_3axfk_207 _line-height-20_3axfk_95 _font-meta_3axfk_131 _size-11_3axfk_35 _weight-medium_3axfk_162 _transform-uppercase_3axfk_242 _reset_3axfk_1 _meta_3axfk_442"
-        )
+        # The date div carries a dozen pencraft utility classes; matching on the one
+        # discriminative token avoids a multi-token comparison against every div.
+        date_element = SEL_DATE.select_one(soup)
         date = date_element.text.strip() if date_element and date_element.text else "Date not found"
 
-        like_count_element = soup.select_one("a.post-ufi-button .label")
+        like_count_element = SEL_LIKE_COUNT.select_one(soup)
         like_count = (
             like_count_element.text.strip()
             if like_count_element and like_count_element.text and like_count_element.text.strip().isdigit()
             else "0"
         )
 
-        content_container = soup.select_one("div.available-content")
+        content_container = SEL_CONTENT.select_one(soup)
         if content_container is None:
             print("No content container found, skipping this post.")
             return None
 
-        content = str(content_container)
-        md = self.html_to_md(content)
-        md_content = self.combine_metadata_and_content(title, subtitle, date, like_count, md)
-        return title, subtitle, like_count, date, md_content
+        # decode() is bs4's serializer; calling it once here yields the string that
+        # both the markdown conversion and the .html artifact share.
+        content = content_container.decode()
+        md = cls.html_to_md(content)
+        md_content = cls.combine_metadata_and_content(title, subtitle, date, like_count, md)
+        return title, subtitle, like_count, date, md_content, content
 
     @abstractmethod
     def get_url_soup(self, url: str) -> Optional[BeautifulSoup]:
         raise NotImplementedError
 
     def save_essays_data_to_json(self, essays_data: list) -> None:
-        data_dir = os.path.join(JSON_DATA_DIR)
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
-
-        json_path = os.path.join(data_dir, f'{self.writer_name}.json')
+        json_path = os.path.join(JSON_DATA_DIR, f'{self.writer_name}.json')
         if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as file:
-                existing_data = json.load(file)
-            essays_data = existing_data + [data for data in essays_data if data not in existing_data]
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(essays_data, f, ensure_ascii=False, indent=4)
+            with open(json_path, 'rb') as file:
+                existing_data = orjson.loads(file.read())
+            existing_links = {data['file_link'] for data in existing_data}
+            essays_data = existing_data + [data for data in essays_data if data['file_link'] not in existing_links]
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(essays_data, option=orjson.OPT_INDENT_2))
+
+    def extract_and_save_post(self, url: str, soup: BeautifulSoup) -> Optional[dict]:
+        return self._save_post_data(url, self.extract_post_data(soup))
+
+    def _save_post_data(self, url: str, post_data: Optional[Tuple[str, str, str, str, str, str]]) -> Optional[dict]:
+        if post_data is None:
+            print(f"Skipping post due to missing data: {url}")
+            return None
+
+        md_filepath = os.path.join(self.md_save_dir, self._md_filename(url))
+        html_filepath = os.path.join(self.html_save_dir, self._html_filename(url))
+
+        title, subtitle, like_count, date, md, content_html = post_data
+        self.save_to_file(md_filepath, md)
+        self.save_to_html_file(html_filepath, content_html)
+
+        return {
+            "title": title,
+            "subtitle": subtitle,
+            "like_count": like_count,
+            "date": date,
+            "file_link": md_filepath,
+            "html_link": html_filepath
+        }
 
     def scrape_posts(self, num_posts_to_scrape: int = 0) -> None:
         essays_data = []
         count = 0
         total = num_posts_to_scrape if num_posts_to_scrape != 0 else len(self.post_urls)
+        downloaded = set(os.listdir(self.md_save_dir))
         for url in tqdm(self.post_urls, total=total):
             try:
-                md_filename = self.get_filename_from_url(url, filetype=".md")
-                html_filename = self.get_filename_from_url(url, filetype=".html")
+                md_filename = self._md_filename(url)
                 md_filepath = os.path.join(self.md_save_dir, md_filename)
-                html_filepath = os.path.join(self.html_save_dir, html_filename)
 
-                if not os.path.exists(md_filepath):
+                if md_filename not in downloaded:
                     soup = self.get_url_soup(url)
                     if soup is None:
                         print(f"Unable to fetch soup for {url}, skipping.")
@@ -279,27 +367,13 @@ class BaseSubstackScraper(ABC):
                             total -= 1
                         continue
 
-                    post_data = self.extract_post_data(soup)
-                    if post_data is None:
-                        print(f"Skipping post due to missing data: {url}")
+                    essay_data = self.extract_and_save_post(url, soup)
+                    if essay_data is None:
                         if num_posts_to_scrape == 0:
                             total -= 1
                         continue
 
-                    title, subtitle, like_count, date, md = post_data
-                    self.save_to_file(md_filepath, md)
-
-                    html_content = self.md_to_html(md)
-                    self.save_to_html_file(html_filepath, html_content)
-
-                    essays_data.append({
-                        "title": title,
-                        "subtitle": subtitle,
-                        "like_count": like_count,
-                        "date": date,
-                        "file_link": md_filepath,
-                        "html_link": html_filepath
-                    })
+                    essays_data.append(essay_data)
                 else:
                     print(f"File already exists: {md_filepath}")
             except Exception as e:
@@ -307,6 +381,7 @@ class BaseSubstackScraper(ABC):
             count += 1
             if num_posts_to_scrape != 0 and count == num_posts_to_scrape:
                 break
+        self._write_queue.join()
         self.save_essays_data_to_json(essays_data=essays_data)
         generate_html_file(author_name=self.writer_name)
 
@@ -315,10 +390,66 @@ class SubstackScraper(BaseSubstackScraper):
     def __init__(self, base_substack_url: str, md_save_dir: str, html_save_dir: str):
         super().__init__(base_substack_url, md_save_dir, html_save_dir)
 
+    def _fetch_post_html(self, url: str) -> Optional[bytes]:
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    def _process_one(self, url: str) -> Optional[dict]:
+        html = self._fetch_post_html(url)
+        if html is None:
+            print(f"Unable to fetch {url}, skipping.")
+            return None
+        # Parsing and markdown conversion are CPU-bound; run them in the
+        # process pool so worker threads go straight back to fetching
+        post_data = self._parse_pool.submit(_parse_and_convert, url, html).result()
+        return self._save_post_data(url, post_data)
+
+    def scrape_posts(self, num_posts_to_scrape: int = 0) -> None:
+        urls = self.post_urls[:num_posts_to_scrape] if num_posts_to_scrape != 0 else self.post_urls
+
+        # One readdir replaces a stat call per URL and yields a clean work list
+        downloaded = set(os.listdir(self.md_save_dir))
+        urls_to_fetch = []
+        for url in urls:
+            md_filename = self._md_filename(url)
+            if md_filename in downloaded:
+                print(f"File already exists: {os.path.join(self.md_save_dir, md_filename)}")
+            else:
+                urls_to_fetch.append(url)
+
+        essays_data = []
+        # spawn, not fork: the writer and fetch threads are already running, and
+        # forking a multithreaded process can clone a held lock into the workers
+        with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+        ) as parse_pool, \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            self._parse_pool = parse_pool
+            futures = {executor.submit(self._process_one, url): url for url in urls_to_fetch}
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                try:
+                    essay_data = future.result()
+                except Exception as e:
+                    print(f"Error scraping post: {e}")
+                    continue
+                if essay_data is not None:
+                    essays_data.append(essay_data)
+
+        self._write_queue.join()
+        self.save_essays_data_to_json(essays_data=essays_data)
+        generate_html_file(author_name=self.writer_name)
+
     def get_url_soup(self, url: str) -> Optional[BeautifulSoup]:
         try:
-            page = requests.get(url, headers=None)
-            soup = BeautifulSoup(page.content, "html.parser")
+            with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as page:
+                page.raw.decode_content = True
+                soup = BeautifulSoup(page.raw, "lxml", parse_only=POST_CONTENT_STRAINER)
             if soup.find("h2", class_="paywall-title"):
                 print(f"Skipping premium article: {url}")
                 return None
@@ -340,21 +471,50 @@ class PremiumSubstackScraper(BaseSubstackScraper):
     ) -> None:
         super().__init__(base_substack_url, md_save_dir, html_save_dir)
 
+        self.headless = headless
+        self.edge_path = edge_path
+        self.edge_driver_path = edge_driver_path
+        self.user_agent = user_agent
+
+        self.driver = None
+        self._start_driver()
+        self.login()
+        self._adopt_driver_cookies()
+
+    def _start_driver(self) -> None:
         options = EdgeOptions()
-        if headless:
+        if self.headless:
             options.add_argument("--headless")
-        if edge_path:
-            options.binary_location = edge_path
-        if user_agent:
-            options.add_argument(f'user-agent={user_agent}')  
+        if self.edge_path:
+            options.binary_location = self.edge_path
+        if self.user_agent:
+            options.add_argument(f'user-agent={self.user_agent}')
 
-        if edge_driver_path:
-            service = Service(executable_path=edge_driver_path)
+        if self.edge_driver_path:
+            service = Service(executable_path=self.edge_driver_path)
         else:
             service = Service(EdgeChromiumDriverManager().install())
 
         self.driver = webdriver.Edge(service=service, options=options)
-        self.login()
+
+    def _adopt_driver_cookies(self) -> None:
+        # Copy the Substack auth cookies onto the requests session: a plain GET
+        # is orders of magnitude cheaper than a full browser page load, and most
+        # premium posts only need the cookies. The logged-in driver stays alive
+        # for posts the cookies can't unlock and is quit when the scrape ends.
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+
+    def _quit_driver(self) -> None:
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def scrape_posts(self, num_posts_to_scrape: int = 0) -> None:
+        try:
+            super().scrape_posts(num_posts_to_scrape)
+        finally:
+            self._quit_driver()
 
     def login(self) -> None:
         self.driver.get("https://substack.com/sign-in")
@@ -386,11 +546,27 @@ class PremiumSubstackScraper(BaseSubstackScraper):
 
     def get_url_soup(self, url: str) -> Optional[BeautifulSoup]:
         try:
-            self.driver.get(url)
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as page:
+                page.raw.decode_content = True
+                soup = BeautifulSoup(page.raw, "lxml", parse_only=POST_CONTENT_STRAINER)
+            if soup.find("h2", class_="paywall-title"):
+                # Cookie auth didn't unlock this post; render it in the browser
+                soup = self._get_url_soup_selenium(url)
+                if soup.find("h2", class_="paywall-title"):
+                    print(f"Skipping premium article (still paywalled after login): {url}")
+                    return None
+            return soup
         except Exception as e:
             raise ValueError(f"Error fetching page: {e}") from e
 
+    def _get_url_soup_selenium(self, url: str) -> BeautifulSoup:
+        if self.driver is None:
+            # The driver was already quit; the fallback is only useful logged in
+            self._start_driver()
+            self.login()
+        self.driver.get(url)
+        return BeautifulSoup(self.driver.page_source, "lxml", parse_only=POST_CONTENT_STRAINER)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Scrape a Substack site.")